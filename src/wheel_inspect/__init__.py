@@ -16,7 +16,15 @@ Visit <https://github.com/wheelodex/wheel-inspect> for more information.
 
 from wheel_filename import ParsedWheelFilename, parse_wheel_filename
 from .inspecting import inspect_dist_info_dir, inspect_wheel
-from .schema import DIST_INFO_SCHEMA, SCHEMA, WHEEL_SCHEMA
+from .schema import (
+    DIST_INFO_SCHEMA,
+    SCHEMA,
+    WHEEL_SCHEMA,
+    is_valid_dist_info,
+    is_valid_wheel,
+    validate_dist_info,
+    validate_wheel,
+)
 
 __version__ = "1.7.2"
 __author__ = "John Thorvald Wodder II"
@@ -31,5 +39,9 @@ __all__ = [
     "WHEEL_SCHEMA",
     "inspect_dist_info_dir",
     "inspect_wheel",
+    "is_valid_dist_info",
+    "is_valid_wheel",
     "parse_wheel_filename",
+    "validate_dist_info",
+    "validate_wheel",
 ]
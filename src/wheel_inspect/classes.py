@@ -1,6 +1,8 @@
 import abc
+from functools import cached_property
 import io
 from pathlib import Path
+import threading
 from zipfile import ZipFile
 from wheel_filename import parse_wheel_filename
 from . import errors
@@ -70,8 +72,28 @@ class DistInfoProvider(abc.ABC):
         except errors.MissingDistInfoFileError:
             raise errors.MissingWheelInfoError()
 
+    # The following properties memoize the results of the above methods so
+    # that inspecting the same resource more than once only parses each file
+    # once.  Failures are not cached, so errors are re-raised on each access.
+
+    @cached_property
+    def metadata(self):
+        return self.get_metadata()
+
+    @cached_property
+    def record(self):
+        return self.get_record()
+
+    @cached_property
+    def wheel_info(self):
+        return self.get_wheel_info()
+
 
 class FileProvider(abc.ABC):
+    #: Whether `get_file_hash()` may be called concurrently from multiple
+    #: threads.  If true, `verify_record()` may hash large files in parallel.
+    parallel_hashing = False
+
     @abc.abstractmethod
     def list_files(self):
         """
@@ -143,19 +165,32 @@ class DistInfoDir(DistInfoProvider):
 
 
 class WheelFile(DistInfoProvider, FileProvider):
+    parallel_hashing = True
+
     def __init__(self, path):
         self.path = Path(path)
         self.parsed_filename = parse_wheel_filename(self.path)
         self.fp = None
         self.zipfile = None
         self._dist_info = None
+        self._owner_thread = None
+        # Idle ZipFiles for use by get_file_hash() on threads other than the
+        # one that opened the wheel, so that concurrent hashing doesn't
+        # serialize on (and constantly re-seek) `self.fp`
+        self._spare_zipfiles = []
+        self._worker_zipfiles = []
 
     def __enter__(self):
         self.fp = self.path.open("rb")
         self.zipfile = ZipFile(self.fp)
+        self._owner_thread = threading.get_ident()
         return self
 
     def __exit__(self, _exc_type, _exc_value, _traceback):
+        for zf in self._worker_zipfiles:
+            zf.close()
+        self._spare_zipfiles.clear()
+        self._worker_zipfiles.clear()
         self.zipfile.close()
         self.fp.close()
         self.fp = None
@@ -184,9 +219,9 @@ class WheelFile(DistInfoProvider, FileProvider):
             "project": namebits.project,
             "version": namebits.version,
             "buildver": namebits.build,
-            "pyver": namebits.python_tags,
-            "abi": namebits.abi_tags,
-            "arch": namebits.platform_tags,
+            "pyver": list(namebits.python_tags),
+            "abi": list(namebits.abi_tags),
+            "arch": list(namebits.platform_tags),
             "file": {
                 "size": self.path.stat().st_size,
             },
@@ -223,5 +258,17 @@ class WheelFile(DistInfoProvider, FileProvider):
         return self.zipfile.getinfo(path).file_size
 
     def get_file_hash(self, path, algorithm):
-        with self.zipfile.open(path) as fp:
-            return digest_file(fp, [algorithm])[algorithm]
+        if threading.get_ident() == self._owner_thread:
+            with self.zipfile.open(path) as fp:
+                return digest_file(fp, [algorithm])[algorithm]
+        # list.pop() and list.append() are atomic, so no lock is needed
+        try:
+            zf = self._spare_zipfiles.pop()
+        except IndexError:
+            zf = ZipFile(self.path)
+            self._worker_zipfiles.append(zf)
+        try:
+            with zf.open(path) as fp:
+                return digest_file(fp, [algorithm])[algorithm]
+        finally:
+            self._spare_zipfiles.append(zf)
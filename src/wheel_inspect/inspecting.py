@@ -1,6 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 import io
-import entry_points_txt
-from readme_renderer.rst import render
+import os
 from . import errors
 from .classes import DistInfoDir, FileProvider, WheelFile
 from .util import (
@@ -49,6 +50,10 @@ def parse_entry_points(fp):
             }
         }
     """
+    # Imported here rather than at module level to keep `import wheel_inspect`
+    # fast for callers that never parse entry points
+    import entry_points_txt
+
     epset = entry_points_txt.load(fp)
     return {
         gr: {
@@ -63,15 +68,22 @@ def parse_entry_points(fp):
     }
 
 
-def readlines(fp):
-    return list(yield_lines(fp))
+def readlines(s):
+    # Only break on universal newlines, as reading the file in text mode
+    # would; `str.splitlines()` also breaks on form feeds, U+0085, etc.
+    return list(yield_lines(s.replace("\r\n", "\n").replace("\r", "\n").split("\n")))
+
+
+def parse_entry_points_str(s):
+    return parse_entry_points(io.StringIO(s, newline=None))
 
 
 EXTRA_DIST_INFO_FILES = [
-    # file name, handler function, result dict key
+    # file name, handler function (taking the decoded file contents), result
+    # dict key
     # <https://setuptools.readthedocs.io/en/latest/formats.html>:
     ("dependency_links.txt", readlines, "dependency_links"),
-    ("entry_points.txt", parse_entry_points, "entry_points"),
+    ("entry_points.txt", parse_entry_points_str, "entry_points"),
     ("namespace_packages.txt", readlines, "namespace_packages"),
     ("top_level.txt", readlines, "top_level"),
 ]
@@ -84,7 +96,7 @@ def inspect(obj):  # (DistInfoProvider) -> dict
     has_dist_info = True
 
     try:
-        record = obj.get_record()
+        record = obj.record
     except errors.WheelValidationError as e:
         about["valid"] = False
         about["validation_error"] = {
@@ -106,7 +118,9 @@ def inspect(obj):  # (DistInfoProvider) -> dict
 
     if has_dist_info:
         try:
-            metadata = obj.get_metadata()
+            # The parsed metadata is cached on `obj`, so give each result its
+            # own copy; this also allows modifying it in place below.
+            metadata = deepcopy(obj.metadata)
         except errors.WheelValidationError as e:
             metadata = {}
             about["valid"] = False
@@ -118,7 +132,7 @@ def inspect(obj):  # (DistInfoProvider) -> dict
             about["dist_info"]["metadata"] = metadata
 
         try:
-            about["dist_info"]["wheel"] = obj.get_wheel_info()
+            about["dist_info"]["wheel"] = deepcopy(obj.wheel_info)
         except errors.WheelValidationError as e:
             about["valid"] = False
             about["validation_error"] = {
@@ -128,10 +142,9 @@ def inspect(obj):  # (DistInfoProvider) -> dict
 
         for fname, parser, key in EXTRA_DIST_INFO_FILES:
             try:
-                with obj.open_dist_info_file(fname) as binfp, io.TextIOWrapper(
-                    binfp, "utf-8"
-                ) as txtfp:
-                    about["dist_info"][key] = parser(txtfp)
+                with obj.open_dist_info_file(fname) as binfp:
+                    content = binfp.read().decode("utf-8")
+                about["dist_info"][key] = parser(content)
             except errors.MissingDistInfoFileError:
                 pass
 
@@ -156,6 +169,10 @@ def inspect(obj):  # (DistInfoProvider) -> dict
         metadata["description"] = {"length": len(metadata["description"])}
         dct = metadata.get("description_content_type")
         if dct is None or split_content_type(dct)[:2] == ("text", "x-rst"):
+            # readme_renderer pulls in docutils, which is slow to import, so
+            # only load it when there's actually something to render
+            from readme_renderer.rst import render
+
             about["derived"]["readme_renders"] = render(readme) is not None
         else:
             about["derived"]["readme_renders"] = True
@@ -200,8 +217,59 @@ def inspect_dist_info_dir(path):
         return inspect(did)
 
 
+#: Minimum total size (in bytes) of the files to hash before `verify_record()`
+#: hashes them in parallel; below this, the thread pool's overhead outweighs
+#: any gain
+PARALLEL_HASH_THRESHOLD = 16 << 20
+
+
 def verify_record(fileprod: FileProvider, record):
     files = set(fileprod.list_files())
+    cpus = os.cpu_count() or 1
+    if fileprod.parallel_hashing and cpus > 1:
+        to_hash = [
+            entry
+            for entry in record
+            if entry.digest is not None
+            and entry.path in files
+            and fileprod.get_file_size(entry.path) == entry.size
+        ]
+        if (
+            len(to_hash) > 1
+            and sum(entry.size for entry in to_hash) >= PARALLEL_HASH_THRESHOLD
+        ):
+            # Hashing is CPU-bound, so there's no point in having more workers
+            # than CPUs.
+            with ThreadPoolExecutor(max_workers=cpus) as executor:
+                # Hashing dominates verification time for large wheels, and
+                # hashlib releases the GIL while digesting, so compute the
+                # digests of all files with correct sizes concurrently up
+                # front.  The checks are still performed in RECORD order so
+                # that the first error reported is the same as when verifying
+                # serially.
+                futures = {
+                    entry.path: executor.submit(
+                        fileprod.get_file_hash, entry.path, entry.digest_algorithm
+                    )
+                    for entry in to_hash
+                }
+                try:
+                    _check_record(
+                        fileprod, record, files, lambda e: futures[e.path].result()
+                    )
+                finally:
+                    for fut in futures.values():
+                        fut.cancel()
+            return
+    _check_record(
+        fileprod,
+        record,
+        files,
+        lambda e: fileprod.get_file_hash(e.path, e.digest_algorithm),
+    )
+
+
+def _check_record(fileprod, record, files, get_digest):
     # Check everything in RECORD against actual values:
     for entry in record:
         if entry.path.endswith("/"):
@@ -217,7 +285,7 @@ def verify_record(fileprod: FileProvider, record):
                     entry.size,
                     file_size,
                 )
-            digest = fileprod.get_file_hash(entry.path, entry.digest_algorithm)
+            digest = get_digest(entry)
             if digest != entry.digest:
                 raise errors.RecordDigestMismatchError(
                     entry.path,
@@ -227,10 +295,9 @@ def verify_record(fileprod: FileProvider, record):
                 )
         elif not is_dist_info_path(entry.path, "RECORD"):
             raise errors.NullEntryError(entry.path)
-        files.discard(entry.path)
     # Check that the only files that aren't in RECORD are signatures:
-    for path in files:
-        if not is_dist_info_path(entry.path, "RECORD.jws") and not is_dist_info_path(
-            entry.path, "RECORD.p7s"
+    for path in sorted(files.difference(record.files)):
+        if not is_dist_info_path(path, "RECORD.jws") and not is_dist_info_path(
+            path, "RECORD.p7s"
         ):
             raise errors.ExtraFileError(path)
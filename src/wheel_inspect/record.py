@@ -1,14 +1,13 @@
-import base64
-from binascii import hexlify, unhexlify
-from collections import OrderedDict
+from binascii import a2b_base64, b2a_base64
 import csv
 import hashlib
+import io
 import re
 import attr
 from . import errors
 
 
-@attr.s
+@attr.s(slots=True)
 class Record:
     files = attr.ib()
 
@@ -22,7 +21,7 @@ class Record:
         return [e.for_json() for e in self.files.values()]
 
 
-@attr.s
+@attr.s(slots=True)
 class RecordEntry:
     path = attr.ib()
     digest_algorithm = attr.ib()
@@ -41,7 +40,8 @@ class RecordEntry:
             )
         if not path:
             raise errors.EmptyPathError()
-        elif "//" in path or "." in path.split("/") or ".." in path.split("/"):
+        parts = path.split("/")
+        if "//" in path or "." in parts or ".." in parts:
             raise errors.NonNormalizedPathError(path)
         elif path.startswith("/"):
             raise errors.AbsolutePathError(path)
@@ -51,19 +51,17 @@ class RecordEntry:
                 raise errors.UnknownDigestError(path, digest_algorithm)
             elif digest_algorithm in ("md5", "sha1"):
                 raise errors.WeakDigestError(path, digest_algorithm)
-            sz = (getattr(hashlib, digest_algorithm)().digest_size * 8 + 5) // 6
-            if not re.fullmatch(r"[-_0-9A-Za-z]{%d}" % (sz,), digest):
+            if not digest_regex(digest_algorithm).fullmatch(digest):
                 raise errors.MalformedDigestError(path, digest_algorithm, digest)
             digest = record_digest2hex(digest)
         else:
             digest_algorithm, digest = None, None
-        if size:
-            try:
-                size = int(size)
-            except ValueError:
-                raise errors.MalformedSizeError(path, size)
-        else:
+        if not size:
             size = None
+        elif size.isascii() and size.isdigit():
+            size = int(size)
+        else:
+            raise errors.MalformedSizeError(path, size)
         if digest is None and size is not None:
             raise errors.EmptyDigestError(path)
         elif digest is not None and size is None:
@@ -89,8 +87,8 @@ class RecordEntry:
 
 def parse_record(fp):
     # Format defined in PEP 376
-    files = OrderedDict()
-    for fields in csv.reader(fp, delimiter=",", quotechar='"'):
+    files = {}
+    for fields in read_csv_rows(fp.read()):
         if not fields:
             continue
         entry = RecordEntry.from_csv_fields(fields)
@@ -100,10 +98,57 @@ def parse_record(fp):
     return Record(files)
 
 
+def read_csv_rows(data):
+    """
+    Split the contents of a :file:`RECORD` file into a list of fields per row,
+    yielding an empty list for each blank line, just like `csv.reader`.
+    Unlike `csv.reader`, an extra empty list may also be yielded for the empty
+    "line" after a trailing newline, so callers must skip empty rows.
+    """
+    if '"' in data:
+        # Quoted fields may contain commas or line breaks, so leave them to the
+        # csv module.
+        yield from csv.reader(
+            io.StringIO(data, newline=""), delimiter=",", quotechar='"'
+        )
+    else:
+        # Without any quoting, each line is just its fields joined by commas.
+        for line in data.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+            yield line.split(",") if line else []
+
+
+#: Cache of compiled regexes for validating base64 nopad digests, keyed by
+#: digest algorithm name
+_DIGEST_RGXES = {}
+
+
+def digest_regex(algorithm):
+    """
+    Return a compiled regex that matches a base64 nopad digest of the correct
+    length for the digest algorithm ``algorithm``
+    """
+    try:
+        return _DIGEST_RGXES[algorithm]
+    except KeyError:
+        sz = (hashlib.new(algorithm).digest_size * 8 + 5) // 6
+        rgx = _DIGEST_RGXES[algorithm] = re.compile(r"[-_0-9A-Za-z]{%d}" % (sz,))
+        return rgx
+
+
+#: Translation table for converting standard base64 to URL-safe base64
+_STD_B64_TRANS = bytes.maketrans(b"+/", b"-_")
+
+#: Translation table for converting URL-safe base64 to standard base64
+_URLSAFE_B64_TRANS = bytes.maketrans(b"-_", b"+/")
+
+
 def hex2record_digest(data):
-    return base64.urlsafe_b64encode(unhexlify(data)).decode("us-ascii").rstrip("=")
+    b64 = b2a_base64(bytes.fromhex(data), newline=False)
+    return b64.translate(_STD_B64_TRANS).rstrip(b"=").decode("us-ascii")
 
 
 def record_digest2hex(data):
-    pad = "=" * (4 - (len(data) & 3))
-    return hexlify(base64.urlsafe_b64decode(data + pad)).decode("us-ascii")
+    # `data` has already been validated against `digest_regex()`, so it can be
+    # fed to binascii directly without going through the base64 module.
+    b64 = data.encode("us-ascii").translate(_URLSAFE_B64_TRANS)
+    return a2b_base64(b64 + b"=" * (-len(b64) & 3)).hex()
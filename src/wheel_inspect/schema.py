@@ -1,4 +1,4 @@
-from copy import deepcopy
+from functools import lru_cache
 
 #: A `JSON Schema <http://json-schema.org>`_ for the structure returned by
 #: `inspect_dist_info_dir()` and by `inspect()` when called on a `DistInfoDir`.
@@ -238,12 +238,16 @@ DIST_INFO_SCHEMA = {
     },
 }
 
+# Only the top-level "required" and "properties" differ from DIST_INFO_SCHEMA,
+# so all other (nested) values are shared between the two schemas rather than
+# copied.  Neither schema may be mutated.
+
 #: A `JSON Schema <http://json-schema.org>`_ for the structure returned by
 #: `inspect_wheel()` and by `inspect()` when called on a `WheelFile`.
-WHEEL_SCHEMA = deepcopy(DIST_INFO_SCHEMA)
-
-WHEEL_SCHEMA["required"].extend(
-    [
+WHEEL_SCHEMA = {
+    **DIST_INFO_SCHEMA,
+    "required": [
+        *DIST_INFO_SCHEMA["required"],
         "filename",
         "project",
         "version",
@@ -252,11 +256,9 @@ WHEEL_SCHEMA["required"].extend(
         "abi",
         "arch",
         "file",
-    ]
-)
-
-WHEEL_SCHEMA["properties"].update(
-    {
+    ],
+    "properties": {
+        **DIST_INFO_SCHEMA["properties"],
         "filename": {"type": "string", "description": "The filename of the wheel"},
         "project": {
             "type": "string",
@@ -302,8 +304,57 @@ WHEEL_SCHEMA["properties"].update(
                 },
             },
         },
-    }
-)
+    },
+}
 
 #: Alias for `WHEEL_SCHEMA`.  Deprecated; use `WHEEL_SCHEMA` instead.
 SCHEMA = WHEEL_SCHEMA
+
+
+@lru_cache(maxsize=None)
+def _get_validator(schema_name):
+    # jsonschema is not a dependency of wheel-inspect, so it is only imported
+    # once someone actually asks for validation.  Checking the schema and
+    # building the validator is much more expensive than validating a single
+    # instance, so the validator is built once per schema and reused.
+    from jsonschema import Draft7Validator
+
+    schema = {"dist_info": DIST_INFO_SCHEMA, "wheel": WHEEL_SCHEMA}[schema_name]
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
+
+
+def validate_dist_info(about):
+    """
+    Validate ``about`` against `DIST_INFO_SCHEMA`, raising a
+    `jsonschema.ValidationError` if it does not conform.  Requires
+    ``jsonschema`` to be installed.
+    """
+    _get_validator("dist_info").validate(about)
+
+
+def validate_wheel(about):
+    """
+    Validate ``about`` against `WHEEL_SCHEMA`, raising a
+    `jsonschema.ValidationError` if it does not conform.  Requires
+    ``jsonschema`` to be installed.
+    """
+    _get_validator("wheel").validate(about)
+
+
+def is_valid_dist_info(about):
+    """
+    Return whether ``about`` conforms to `DIST_INFO_SCHEMA`.  This is faster
+    than catching the exception from `validate_dist_info()`, as no error
+    objects are built.  Requires ``jsonschema`` to be installed.
+    """
+    return _get_validator("dist_info").is_valid(about)
+
+
+def is_valid_wheel(about):
+    """
+    Return whether ``about`` conforms to `WHEEL_SCHEMA`.  This is faster than
+    catching the exception from `validate_wheel()`, as no error objects are
+    built.  Requires ``jsonschema`` to be installed.
+    """
+    return _get_validator("wheel").is_valid(about)
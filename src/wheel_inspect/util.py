@@ -1,12 +1,15 @@
-from email.message import EmailMessage
+from functools import lru_cache
 import hashlib
 from keyword import iskeyword
 import re
+from types import MappingProxyType
 from typing import List, Optional, Tuple
 from packaging.utils import canonicalize_name, canonicalize_version
 from .errors import DistInfoError
 
-DIGEST_CHUNK_SIZE = 65535
+# Large enough that per-chunk Python overhead is negligible next to the time
+# hashlib spends (with the GIL released) digesting each chunk
+DIGEST_CHUNK_SIZE = 1 << 20
 
 DIST_INFO_DIR_RGX = re.compile(
     r"[A-Za-z0-9](?:[A-Za-z0-9._]*[A-Za-z0-9])?-[A-Za-z0-9_.!+]+\.dist-info"
@@ -16,27 +19,47 @@ DATA_DIR_RGX = re.compile(
     r"[A-Za-z0-9](?:[A-Za-z0-9._]*[A-Za-z0-9])?-[A-Za-z0-9_.!+]+\.data"
 )
 
+# RFC 7230 ``tchar`` characters, minus ``*``, ``'``, and ``%``, which the
+# email package treats specially (RFC 2231 parameter encoding) in both
+# parameter names and values; values containing them are left to the email
+# package
+_CT_TOKEN = r"[-!#$&+.^_`|~0-9A-Za-z]+"
+
+#: Regex for :mailheader:`Content-Type` values simple enough to split up
+#: without the `email` package: unquoted ``token=token`` parameters only
+SIMPLE_CONTENT_TYPE_RGX = re.compile(
+    rf"\s*({_CT_TOKEN})/({_CT_TOKEN})\s*((?:;\s*{_CT_TOKEN}={_CT_TOKEN}\s*)*);?\s*",
+    re.ASCII,
+)
+
+CONTENT_TYPE_PARAM_RGX = re.compile(rf"({_CT_TOKEN})=({_CT_TOKEN})")
+
 # <https://discuss.python.org/t/identifying-parsing-binary-extension-filenames/>
 MODULE_EXT_RGX = re.compile(r"(?<=.)\.(?:py|pyd|so|[-A-Za-z0-9_]+\.(?:pyd|so))\Z")
 
 
 def extract_modules(filelist):
     modules = set()
+    # Bound once here rather than looked up on every iteration
+    ext_search = MODULE_EXT_RGX.search
     for fname in filelist:
-        parts = fname.split("/")
-        if not parts:
+        # Check the extension first so that the (usually many) non-module
+        # files are skipped without splitting up their paths
+        dirname, sep, basename = fname.rpartition("/")
+        m = ext_search(basename)
+        if m is None:
             continue
+        parts = dirname.split("/") if sep else []
         if (
-            len(parts) > 2
-            and is_data_dir(parts[0])
+            len(parts) > 1
             and parts[1] in ("purelib", "platlib")
+            and is_data_dir(parts[0])
         ):
             parts = parts[2:]
-        m = MODULE_EXT_RGX.search(parts[-1])
-        if m is None:
-            continue
-        parts[-1] = parts[-1][: m.start()]
-        if not all(p.isidentifier() and not iskeyword(p) for p in parts):
+        parts.append(basename[: m.start()])
+        # `map()` over the C-level predicates avoids running a generator frame
+        # per path component
+        if not all(map(str.isidentifier, parts)) or any(map(iskeyword, parts)):
             continue
         if parts[-1] == "__init__" and len(parts) > 1:
             parts.pop()
@@ -67,24 +90,45 @@ def fieldnorm(s):
     return s.lower().replace("-", "_")
 
 
+# Project names recur heavily across wheels inspected by the same process (and
+# within a single ``Requires-Dist`` list), so normalized names are worth
+# remembering
+@lru_cache(maxsize=4096)
+def _canonicalize_name(name):
+    return canonicalize_name(name)
+
+
 def unique_projects(projects):
     seen = set()
+    seen_add = seen.add
     for p in projects:
-        pn = canonicalize_name(p)
+        pn = _canonicalize_name(p)
         if pn not in seen:
+            seen_add(pn)
             yield p
-        seen.add(pn)
 
 
 def digest_file(fp, algorithms):
-    digests = {alg: getattr(hashlib, alg)() for alg in algorithms}
-    for chunk in iter(lambda: fp.read(DIGEST_CHUNK_SIZE), b""):
-        for d in digests.values():
-            d.update(chunk)
+    digests = {alg: hashlib.new(alg) for alg in algorithms}
+    updaters = tuple(d.update for d in digests.values())
+    read = fp.read
+    while chunk := read(DIGEST_CHUNK_SIZE):
+        for update in updaters:
+            update(chunk)
     return {k: v.hexdigest() for k, v in digests.items()}
 
 
 def split_content_type(s):
+    m = SIMPLE_CONTENT_TYPE_RGX.fullmatch(s)
+    if m is not None:
+        params = {k.lower(): v for k, v in CONTENT_TYPE_PARAM_RGX.findall(m[3])}
+        if len(params) == m[3].count("="):
+            # Match the read-only mapping returned by the email package below
+            return (m[1].lower(), m[2].lower(), MappingProxyType(params))
+    # Quoted strings, comments, repeated parameters, malformed values, etc. are
+    # left to the email package.
+    from email.message import EmailMessage
+
     msg = EmailMessage()
     msg["Content-Type"] = s
     ct = msg["Content-Type"]
@@ -92,11 +136,13 @@ def split_content_type(s):
 
 
 def is_dist_info_dir(name):
-    return DIST_INFO_DIR_RGX.fullmatch(name) is not None
+    # The endswith() checks here & in is_data_dir() cheaply reject most names,
+    # which the regexes would otherwise backtrack over in their entirety
+    return name.endswith(".dist-info") and DIST_INFO_DIR_RGX.fullmatch(name) is not None
 
 
 def is_data_dir(name):
-    return DATA_DIR_RGX.fullmatch(name) is not None
+    return name.endswith(".data") and DATA_DIR_RGX.fullmatch(name) is not None
 
 
 def is_dist_info_path(path, name):
@@ -126,20 +172,19 @@ def find_dist_info_dir(
     :raises DistInfoError: if the name & version of the ``.dist-info``
         directory are not normalization-equivalent to ``project`` & ``version``
     """
-    canon_project = canonicalize_name(project)
+    canon_project = _canonicalize_name(project)
     canon_version = canonicalize_version(version.replace("_", "-"))
-    dist_info_dirs = set()
-    for n in namelist:
-        basename = n.rstrip("/").split("/")[0]
-        if is_dist_info_dir(basename):
-            dist_info_dirs.add(basename)
+    # Wheels have far fewer top-level entries than files, so collect those
+    # first and only test them
+    top_level = {n.partition("/")[0] for n in namelist}
+    dist_info_dirs = {name for name in top_level if is_dist_info_dir(name)}
     if len(dist_info_dirs) > 1:
         raise DistInfoError("Wheel contains multiple .dist-info directories")
     elif len(dist_info_dirs) == 1:
         dist_info_dir = next(iter(dist_info_dirs))
         diname, _, diversion = dist_info_dir[: -len(".dist-info")].partition("-")
         if (
-            canonicalize_name(diname) != canon_project
+            _canonicalize_name(diname) != canon_project
             or canonicalize_version(diversion.replace("_", "-")) != canon_version
         ):
             raise DistInfoError(
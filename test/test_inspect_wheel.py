@@ -1,7 +1,7 @@
 import json
 from operator import attrgetter
 from pathlib import Path
-from jsonschema import validate
+from jsonschema import ValidationError, validate
 import pytest
 from testing_lib import filecases
 from wheel_inspect import (
@@ -9,7 +9,13 @@ from wheel_inspect import (
     WHEEL_SCHEMA,
     inspect_dist_info_dir,
     inspect_wheel,
+    is_valid_dist_info,
+    is_valid_wheel,
+    validate_dist_info,
+    validate_wheel,
 )
+from wheel_inspect.classes import WheelFile
+from wheel_inspect.inspecting import inspect
 
 
 @pytest.mark.parametrize("whlfile,expected", filecases("wheels", "*.whl"))
@@ -17,6 +23,49 @@ def test_inspect_wheel(whlfile, expected):
     inspection = inspect_wheel(whlfile)
     assert inspection == expected
     validate(inspection, WHEEL_SCHEMA)
+    validate_wheel(inspection)
+    assert is_valid_wheel(inspection)
+
+
+@pytest.mark.parametrize("whlfile,expected", filecases("wheels", "*.whl"))
+def test_inspect_wheel_twice(whlfile, expected, monkeypatch):
+    with WheelFile(whlfile) as wf:
+        parsed = {}
+        for name in ("get_record", "get_metadata", "get_wheel_info"):
+            parsed[name] = 0
+            monkeypatch.setattr(wf, name, counting(getattr(wf, name), parsed, name))
+        first = inspect(wf)
+        second = inspect(wf)
+    assert first == expected
+    assert second == expected
+    # Each file is parsed at most once.  (Failures are not cached, so parsing
+    # a bad file is retried; those calls are not counted.)
+    assert all(n <= 1 for n in parsed.values())
+    if first["valid"] or first["validation_error"]["type"] != "DistInfoError":
+        assert parsed == dict.fromkeys(parsed, 1)
+    # The results must not share any mutable objects:
+    firstids = set(map(id, mutables(first)))
+    assert not any(id(obj) in firstids for obj in mutables(second))
+
+
+def counting(func, counter, name):
+    def wrapped(*args, **kwargs):
+        r = func(*args, **kwargs)
+        counter[name] += 1
+        return r
+
+    return wrapped
+
+
+def mutables(obj):
+    if isinstance(obj, dict):
+        yield obj
+        for v in obj.values():
+            yield from mutables(v)
+    elif isinstance(obj, list):
+        yield obj
+        for v in obj:
+            yield from mutables(v)
 
 
 @pytest.mark.parametrize(
@@ -34,3 +83,14 @@ def test_inspect_dist_info_dir(didir):
     inspection = inspect_dist_info_dir(didir)
     assert inspection == expected
     validate(inspection, DIST_INFO_SCHEMA)
+    validate_dist_info(inspection)
+    assert is_valid_dist_info(inspection)
+
+
+def test_validate_invalid():
+    with pytest.raises(ValidationError):
+        validate_wheel({"valid": True, "dist_info": {}, "derived": {}})
+    with pytest.raises(ValidationError):
+        validate_dist_info({"valid": "yes", "dist_info": {}, "derived": {}})
+    assert not is_valid_wheel({"valid": True, "dist_info": {}, "derived": {}})
+    assert not is_valid_dist_info({"valid": "yes", "dist_info": {}, "derived": {}})
@@ -1,6 +1,6 @@
 import pytest
 from testing_lib import filecases
-from wheel_inspect.inspecting import parse_entry_points
+from wheel_inspect.inspecting import parse_entry_points, readlines
 from wheel_inspect.metadata import parse_metadata
 from wheel_inspect.wheel_info import parse_wheel_info
 
@@ -21,3 +21,16 @@ def test_parse_entry_points(epfile, expected):
 def test_parse_wheel_info(wifile, expected):
     with wifile.open(encoding="utf-8") as fp:
         assert parse_wheel_info(fp) == expected
+
+
+@pytest.mark.parametrize(
+    "s,lines",
+    [
+        ("", []),
+        ("foo\nbar\n", ["foo", "bar"]),
+        ("foo\r\n  bar  \r\n\r\n# comment\rbaz", ["foo", "bar", "baz"]),
+        ("foo\x0cbar\nbaz\x85qux\u2028quux", ["foo\x0cbar", "baz\x85qux\u2028quux"]),
+    ],
+)
+def test_readlines(s, lines):
+    assert readlines(s) == lines
@@ -102,3 +102,42 @@ def test_parse_bad_records(recfile):
             parse_record(fp)
         assert type(excinfo.value).__name__ == expected["type"]
         assert str(excinfo.value) == expected["str"]
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_parse_record_quoted(newline):
+    record = parse_record(
+        StringIO(
+            newline.join(
+                [
+                    '"foo,bar.py",sha256=47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU,0',
+                    "baz.py,sha256=47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU,0",
+                    "",
+                    "foo-1.0.dist-info/RECORD,,",
+                    "",
+                ]
+            ),
+            newline="",
+        )
+    )
+    assert [e.path for e in record] == [
+        "foo,bar.py",
+        "baz.py",
+        "foo-1.0.dist-info/RECORD",
+    ]
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_parse_record_line_endings(newline):
+    record = parse_record(
+        StringIO(
+            newline.join(
+                [
+                    "foo.py,sha256=47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU,0",
+                    "foo-1.0.dist-info/RECORD,,",
+                ]
+            ),
+            newline="",
+        )
+    )
+    assert [e.path for e in record] == ["foo.py", "foo-1.0.dist-info/RECORD"]
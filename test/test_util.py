@@ -1,12 +1,16 @@
+from io import BytesIO
+from types import MappingProxyType
 import pytest
 from wheel_inspect.errors import DistInfoError
 from wheel_inspect.util import (
+    digest_file,
     extract_modules,
     find_dist_info_dir,
     is_data_dir,
     is_dist_info_dir,
     split_content_type,
     split_keywords,
+    unique_projects,
 )
 
 
@@ -254,10 +258,30 @@ def test_extract_modules(filelist, modules):
             "text/markdown; charset=utf-8; variant=GFM",
             ("text", "markdown", {"charset": "utf-8", "variant": "GFM"}),
         ),
+        ("Text/Plain;Charset=UTF-8;", ("text", "plain", {"charset": "UTF-8"})),
+        (
+            'text/markdown; variant="GFM"',
+            ("text", "markdown", {"variant": "GFM"}),
+        ),
+        (
+            "text/plain; title*=us-ascii'en-us'This%20is",
+            ("text", "plain", {"title": "This is"}),
+        ),
+        ("text/plain; a*0=foo; a*1=bar", ("text", "plain", {"a": "foobar"})),
+        ("text/x-rst (comment)", ("text", "x-rst", {})),
+        ("text / x-rst", ("text", "x-rst", {})),
+        ("text/plain; a=b*c", ("text", "plain", {"a": "b"})),
+        ("text/plain; a=b'c", ("text", "plain", {})),
+        ("text/plain; charset=utf-8'x", ("text", "plain", {})),
+        ("text/plain; a'=b", ("text", "plain", {})),
+        ("text/plain; a%=b", ("text", "plain", {})),
     ],
 )
 def test_split_content_type(s, ct):
-    assert split_content_type(s) == ct
+    maintype, subtype, params = split_content_type(s)
+    assert (maintype, subtype, dict(params)) == ct
+    # Both the fast path & the email fallback return a read-only mapping:
+    assert isinstance(params, MappingProxyType)
 
 
 @pytest.mark.parametrize(
@@ -409,4 +433,31 @@ def test_find_dist_info_dir_error(namelist, project, version, msg):
     assert str(excinfo.value) == msg
 
 
+@pytest.mark.parametrize(
+    "projects,expected",
+    [
+        ([], []),
+        (["foo", "bar"], ["foo", "bar"]),
+        (
+            ["Foo.Bar", "baz", "foo-bar", "FOO_BAR", "Baz", "quux"],
+            ["Foo.Bar", "baz", "quux"],
+        ),
+    ],
+)
+def test_unique_projects(projects, expected):
+    assert list(unique_projects(projects)) == expected
+
+
+@pytest.mark.parametrize("algorithms", [["sha256"], ["sha256", "md5"]])
+def test_digest_file_from_current_position(algorithms):
+    fp = BytesIO(b"abc")
+    fp.read(1)
+    digests = digest_file(fp, algorithms)
+    assert (
+        digests["sha256"]
+        == "1e0bbd6c686ba050b8eb03ffeedc64fdc9d80947fce821abbe5d6dc8d252c5ac"
+    )
+    assert fp.tell() == 3
+
+
 ### TODO: Add more test cases for all functions!
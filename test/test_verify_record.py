@@ -1,10 +1,21 @@
+import threading
+from zipfile import ZipFile
 import pytest
-from testing_lib import filecases
+from testing_lib import DATA_DIR, filecases
+from wheel_inspect import inspecting
 from wheel_inspect.classes import WheelFile
 from wheel_inspect.errors import WheelValidationError
 from wheel_inspect.inspecting import verify_record
 
 
+@pytest.fixture(params=[False, True], ids=["serial", "parallel"])
+def hashing_mode(request, monkeypatch):
+    if request.param:
+        monkeypatch.setattr(inspecting.os, "cpu_count", lambda: 4)
+        monkeypatch.setattr(inspecting, "PARALLEL_HASH_THRESHOLD", 0)
+
+
+@pytest.mark.usefixtures("hashing_mode")
 @pytest.mark.parametrize("whlfile,expected", filecases("bad-wheels", "*.whl"))
 def test_verify_bad_wheels(whlfile, expected):
     with WheelFile(whlfile) as whl:
@@ -12,3 +23,49 @@ def test_verify_bad_wheels(whlfile, expected):
             verify_record(whl, whl.get_record())
         assert type(excinfo.value).__name__ == expected["type"]
         assert str(excinfo.value) == expected["str"]
+
+
+def test_verify_record_signature_files(tmp_path):
+    whlfile = tmp_path / "signed-1.0.0-py3-none-any.whl"
+    with ZipFile(whlfile, "w") as zf:
+        zf.writestr("signed.py", "")
+        zf.writestr(
+            "signed-1.0.0.dist-info/RECORD",
+            "signed.py,sha256=47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU,0\n"
+            "signed-1.0.0.dist-info/RECORD,,\n",
+        )
+        zf.writestr("signed-1.0.0.dist-info/RECORD.jws", "{}")
+        zf.writestr("signed-1.0.0.dist-info/RECORD.p7s", "")
+    with WheelFile(whlfile) as whl:
+        verify_record(whl, whl.get_record())
+
+
+@pytest.mark.usefixtures("hashing_mode")
+@pytest.mark.parametrize("whlfile,expected", filecases("wheels", "*.whl"))
+def test_verify_wheels(whlfile, expected):
+    with WheelFile(whlfile) as whl:
+        try:
+            verify_record(whl, whl.get_record())
+        except WheelValidationError as e:
+            assert expected["validation_error"] == {
+                "type": type(e).__name__,
+                "str": str(e),
+            }
+        else:
+            assert expected["valid"]
+
+
+@pytest.mark.usefixtures("hashing_mode")
+def test_verify_record_serial_provider():
+    class SerialWheelFile(WheelFile):
+        parallel_hashing = False
+
+        def get_file_hash(self, path, algorithm):
+            threads.add(threading.get_ident())
+            return super().get_file_hash(path, algorithm)
+
+    threads = set()
+    whlfile = DATA_DIR / "wheels" / "appr-0.7.4-py2.py3-none-any.whl"
+    with SerialWheelFile(whlfile) as whl:
+        verify_record(whl, whl.get_record())
+    assert threads == {threading.get_ident()}